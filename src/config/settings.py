@@ -1,6 +1,7 @@
 import os
 import logging
 import sys
+from functools import lru_cache
 
 # NetBox Configuration
 # CRITICAL: These MUST be set as environment variables - never hardcode credentials!
@@ -116,9 +117,13 @@ def validate_site_prefixes():
     print(f"INFO: Sites with network prefixes: {sorted(sites_with_prefixes)}", file=sys.stderr)
     print(f"INFO: Total network+site combinations: {len(configured_combinations)}", file=sys.stderr)
 
+@lru_cache(maxsize=256)
 def get_site_prefix(site: str, vrf: str = None) -> str:
     """Get the IP prefix for a given site and network/VRF
 
+    Cached: NETWORK_SITE_IP_PREFIXES is built once at import. Call
+    get_site_prefix.cache_clear() if it is ever changed at runtime.
+
     Args:
         site: Site name (e.g., "Site1")
         vrf: VRF/Network name (e.g., "Network1"). If None, tries "default" network
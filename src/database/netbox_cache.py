@@ -11,7 +11,7 @@ import time
 from typing import Optional, Any, Dict
 import asyncio
 from .netbox_constants import (
-    CACHE_KEY_REDBULL_TENANT_ID, CACHE_KEY_PREFIXES, CACHE_KEY_VLANS, CACHE_KEY_VRFS,
+    CACHE_KEY_REDBULL_TENANT_ID, CACHE_KEY_PREFIXES, CACHE_KEY_VLANS, CACHE_KEY_VRFS, CACHE_KEY_VRF_SET,
     CACHE_TTL_SHORT, CACHE_TTL_MEDIUM, CACHE_TTL_LONG
 )
 
@@ -25,6 +25,7 @@ _cache: Dict[str, Dict[str, Any]] = {
     CACHE_KEY_VLANS: {"data": None, "timestamp": 0, "ttl": CACHE_TTL_MEDIUM},  # 10 minutes
     CACHE_KEY_REDBULL_TENANT_ID: {"data": None, "timestamp": 0, "ttl": CACHE_TTL_LONG},  # 1 hour
     CACHE_KEY_VRFS: {"data": None, "timestamp": 0, "ttl": CACHE_TTL_LONG},  # 1 hour
+    CACHE_KEY_VRF_SET: {"data": None, "timestamp": 0, "ttl": CACHE_TTL_LONG},  # 1 hour (frozenset of CACHE_KEY_VRFS)
     "site_groups": {"data": None, "timestamp": 0, "ttl": CACHE_TTL_LONG},  # 1 hour
     "roles": {"data": None, "timestamp": 0, "ttl": CACHE_TTL_LONG},  # 1 hour
     "tenants": {"data": None, "timestamp": 0, "ttl": CACHE_TTL_LONG},  # 1 hour
@@ -34,6 +34,7 @@ CACHE_KEY_TENANT_REDBULL = "tenant_redbull"
 CACHE_KEY_PREFIXES = "prefixes"
 CACHE_KEY_VLANS = "vlans"
 CACHE_KEY_VRFS = "vrfs"
+CACHE_KEY_VRF_SET = "vrf_set"
 
 # Cache TTL values (in seconds)
 CACHE_TTL_SHORT = 300      # 5 minutes - VLAN groups (may change with new allocations)
@@ -5,17 +5,21 @@ This module provides helper functions for fetching and managing NetBox objects
 (VRF, VLAN, Tenant, Role, Site Group, VLAN Group).
 """
 
+import asyncio
 import logging
 import re
-from typing import Optional, List
+from typing import Optional, List, FrozenSet
 from fastapi import HTTPException
 
 from .netbox_client import get_netbox_client, run_netbox_get, run_netbox_write
-from .netbox_cache import get_cached, set_cache, invalidate_cache
+from .netbox_cache import (
+    get_cached, set_cache, invalidate_cache,
+    get_inflight_request, set_inflight_request, remove_inflight_request
+)
 from .netbox_utils import safe_get_id, safe_get_attr
 from .netbox_constants import (
     TENANT_REDBULL, ROLE_DATA, STATUS_ACTIVE, VLAN_GROUP_PREFIX,
-    CACHE_KEY_REDBULL_TENANT_ID, CACHE_KEY_PREFIXES, CACHE_KEY_VLANS,
+    CACHE_KEY_REDBULL_TENANT_ID, CACHE_KEY_PREFIXES, CACHE_KEY_VLANS, CACHE_KEY_VRFS, CACHE_KEY_VRF_SET,
     get_tenant_cache_key, get_role_cache_key,
     format_vlan_group_name, get_vlan_group_cache_key,
     CACHE_TTL_SHORT, CACHE_TTL_LONG
@@ -326,24 +330,59 @@ class NetBoxHelpers:
             raise
 
     async def get_vrfs(self) -> List[str]:
-        """Get list of available VRFs from NetBox (cached for 1 hour)"""
+        """Get list of available VRFs from NetBox (cached for 1 hour)
+
+        Concurrent cache misses share a single in-flight fetch. It is awaited
+        through asyncio.shield, so a cancelled caller doesn't cancel it for the
+        others and the result still reaches the cache.
+        """
         # Check cache first - VRFs rarely change
-        cached_vrfs = get_cached("vrfs")
+        cached_vrfs = get_cached(CACHE_KEY_VRFS)
         if cached_vrfs is not None:
             return cached_vrfs
 
+        # Check if another request is already fetching VRFs
+        inflight_task = get_inflight_request(CACHE_KEY_VRFS)
+        if inflight_task:
+            try:
+                return await asyncio.shield(inflight_task)
+            except Exception as e:
+                logger.error(f"In-flight VRF request failed: {e}")
+
+        fetch_task = asyncio.create_task(self._fetch_and_cache_vrfs())
+        set_inflight_request(CACHE_KEY_VRFS, fetch_task)
+        return await asyncio.shield(fetch_task)
+
+    async def _fetch_and_cache_vrfs(self) -> List[str]:
+        """Fetch VRF names and cache them (runs as the shared in-flight task)"""
+        try:
+            vrf_names = await self._fetch_vrf_names()
+            # Cache VRFs for 1 hour (they rarely change), plus a set view for membership checks
+            set_cache(CACHE_KEY_VRFS, vrf_names)
+            set_cache(CACHE_KEY_VRF_SET, frozenset(vrf_names))
+            return vrf_names
+        finally:
+            remove_inflight_request(CACHE_KEY_VRFS)
+
+    async def get_vrf_set(self) -> FrozenSet[str]:
+        """Get available VRF names as a frozenset (cached next to the VRF list)"""
+        cached_vrf_set = get_cached(CACHE_KEY_VRF_SET)
+        if cached_vrf_set is not None:
+            return cached_vrf_set
+
+        # Rebuild from the VRF list (e.g. after the startup prefetch, which caches only the list)
+        vrf_set = frozenset(await self.get_vrfs())
+        set_cache(CACHE_KEY_VRF_SET, vrf_set)
+        return vrf_set
+
+    async def _fetch_vrf_names(self) -> List[str]:
+        """Fetch VRF names from NetBox (uncached)"""
         try:
             vrfs = await run_netbox_get(
                 lambda: list(self.nb.ipam.vrfs.all()),
                 "fetch VRFs"
             )
-            vrf_names = [vrf.name for vrf in vrfs]
-
-            # Cache VRFs for 1 hour (they rarely change)
-            set_cache("vrfs", vrf_names)
-
-            return vrf_names
+            return [vrf.name for vrf in vrfs]
         except Exception as e:
             logger.error(f"Error fetching VRFs from NetBox: {e}", exc_info=True)
             raise
-
@@ -6,7 +6,7 @@ for managing VLANs and IP prefixes (segments).
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet
 from datetime import datetime, timezone
 
 from .netbox_client import get_netbox_client, close_netbox_client, run_netbox_get
@@ -130,6 +130,9 @@ class NetBoxStorage:
     async def get_vrfs(self) -> List[str]:
         return await self.helpers.get_vrfs()
 
+    async def get_vrf_set(self) -> FrozenSet[str]:
+        return await self.helpers.get_vrf_set()
+
 
 def get_storage() -> NetBoxStorage:
     """Get the NetBox storage instance"""
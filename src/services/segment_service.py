@@ -4,7 +4,21 @@ from fastapi import HTTPException
 
 from ..models.schemas import Segment
 from ..utils.database_utils import DatabaseUtils
-from ..utils.validators import Validators
+from ..utils.validators import (
+    OrganizationValidators,
+    SegmentOverlapIndex,
+    EpgIndex,
+    validate_site,
+    validate_vrf,
+    validate_epg_name,
+    validate_vlan_id,
+    validate_segment_all,
+    validate_description,
+    validate_ip_overlap,
+    validate_vlan_name_uniqueness,
+    validate_object_id,
+    validate_segment_not_allocated,
+)
 from ..utils.error_handlers import handle_netbox_errors, retry_on_network_error
 from ..utils.logging_decorators import log_operation_timing
 
@@ -14,40 +28,52 @@ class SegmentService:
     """Service class for segment management operations"""
     
     @staticmethod
-    async def _validate_segment_data(segment: Segment, exclude_id: str = None) -> None:
-        """Common validation for segment data"""
+    async def _validate_segment_data(
+        segment: Segment,
+        exclude_id: str = None,
+        existing_segments: Optional[List[Dict[str, Any]]] = None,
+        overlap_index: Optional[SegmentOverlapIndex] = None,
+        epg_index: Optional[EpgIndex] = None
+    ) -> None:
+        """Common validation for segment data
+
+        Bulk callers pass pre-fetched existing_segments (and overlap/EPG indexes built
+        from them) so each row doesn't refetch and rescan every segment. When
+        overlap_index is given, the overlap check uses it instead of the list.
+        """
         # Basic field validation
-        Validators.validate_site(segment.site)
-        await Validators.validate_vrf(segment.vrf)  # VRF validation (async)
-        Validators.validate_epg_name(segment.epg_name)
-        Validators.validate_vlan_id(segment.vlan_id)
+        validate_site(segment.site)
+        await validate_vrf(segment.vrf)  # VRF validation (async)
+        validate_epg_name(segment.epg_name)
+        validate_vlan_id(segment.vlan_id)
 
-        # Network validation (with network-specific site prefix)
-        Validators.validate_segment_format(segment.segment, segment.site, segment.vrf)
-        Validators.validate_subnet_mask(segment.segment)
-        Validators.validate_no_reserved_ips(segment.segment)
-        Validators.validate_network_broadcast_gateway(segment.segment)
+        # Network validation (with network-specific site prefix) - format, subnet mask,
+        # reserved ranges and size, all on a single parse of the segment
+        validate_segment_all(segment.segment, segment.site, segment.vrf)
 
         # Description validation
         if segment.description:
-            Validators.validate_description(segment.description)
+            validate_description(segment.description)
 
-        # IP overlap validation - get all existing segments
-        existing_segments = await DatabaseUtils.get_segments_with_filters()
-        if exclude_id:
-            # Exclude the segment being updated
-            existing_segments = [s for s in existing_segments if str(s.get("_id")) != str(exclude_id)]
+        # IP overlap validation - get all existing segments (unless pre-fetched)
+        if existing_segments is None:
+            existing_segments = await DatabaseUtils.get_segments_with_filters()
 
-        Validators.validate_ip_overlap(segment.segment, existing_segments)
+        validate_ip_overlap(
+            segment.segment,
+            overlap_index if overlap_index is not None else existing_segments,
+            exclude_id=exclude_id  # Exclude the segment being updated
+        )
 
         # EPG name uniqueness validation (scoped to network+site)
-        Validators.validate_vlan_name_uniqueness(
+        validate_vlan_name_uniqueness(
             site=segment.site,
             vrf=segment.vrf,
             epg_name=segment.epg_name,
             vlan_id=segment.vlan_id,
             existing_segments=existing_segments,
-            exclude_id=exclude_id
+            exclude_id=exclude_id,
+            index=epg_index
         )
     
     @staticmethod
@@ -63,6 +89,18 @@ class SegmentService:
             "description": segment.description
         }
     
+    @staticmethod
+    def _is_noop_update(existing_segment: Dict[str, Any], update_data: Dict[str, Any]) -> bool:
+        """Check if applying update_data would leave the stored segment unchanged"""
+        for key, value in update_data.items():
+            current = existing_segment.get(key)
+            if key == "description":
+                # Empty description is stored as "" but may arrive as None
+                value, current = value or "", current or ""
+            if current != value:
+                return False
+        return True
+
     @staticmethod
     @handle_netbox_errors
     @retry_on_network_error(max_retries=3)
@@ -119,7 +157,7 @@ class SegmentService:
     async def get_segment_by_id(segment_id: str) -> Dict[str, Any]:
         """Get a single segment by ID"""
         # Validate ObjectId format
-        Validators.validate_object_id(segment_id)
+        validate_object_id(segment_id)
 
         # Get the segment
         segment = await DatabaseUtils.get_segment_by_id(segment_id)
@@ -140,16 +178,22 @@ class SegmentService:
     async def update_segment(segment_id: str, updated_segment: Segment) -> Dict[str, str]:
         """Update a segment"""
         # Validate ObjectId format
-        Validators.validate_object_id(segment_id)
-
-        # Validate segment data (exclude self from overlap check)
-        await SegmentService._validate_segment_data(updated_segment, exclude_id=segment_id)
+        validate_object_id(segment_id)
 
         # Check if segment exists
         existing_segment = await DatabaseUtils.get_segment_by_id(segment_id)
         if not existing_segment:
             raise HTTPException(status_code=404, detail="Segment not found")
 
+        # Nothing changed (e.g. saved without edits) - skip validation and the NetBox write
+        update_data = SegmentService._segment_to_dict(updated_segment)
+        if SegmentService._is_noop_update(existing_segment, update_data):
+            logger.info(f"Segment {segment_id} unchanged, skipping update")
+            return {"message": "Segment updated successfully"}
+
+        # Validate segment data (exclude self from overlap check)
+        await SegmentService._validate_segment_data(updated_segment, exclude_id=segment_id)
+
         # VLAN ID is immutable - cannot be changed after creation
         if existing_segment["vlan_id"] != updated_segment.vlan_id:
             raise HTTPException(
@@ -174,7 +218,6 @@ class SegmentService:
                 )
 
         # Update the segment
-        update_data = SegmentService._segment_to_dict(updated_segment)
         success = await DatabaseUtils.update_segment_by_id(segment_id, update_data)
 
         if not success:
@@ -193,7 +236,7 @@ class SegmentService:
         logger.info(f"Updating cluster assignment for segment: {segment_id}")
 
         # Validate ObjectId format
-        Validators.validate_object_id(segment_id)
+        validate_object_id(segment_id)
 
         # Check if segment exists
         existing_segment = await DatabaseUtils.get_segment_by_id(segment_id)
@@ -245,7 +288,7 @@ class SegmentService:
     async def delete_segment(segment_id: str) -> Dict[str, str]:
         """Delete a segment"""
         # Validate ObjectId format
-        Validators.validate_object_id(segment_id)
+        validate_object_id(segment_id)
 
         # Check if segment exists and is not allocated
         segment = await DatabaseUtils.get_segment_by_id(segment_id)
@@ -253,7 +296,7 @@ class SegmentService:
             raise HTTPException(status_code=404, detail="Segment not found")
 
         # Validate segment can be deleted
-        Validators.validate_segment_not_allocated(segment)
+        validate_segment_not_allocated(segment)
 
         # Delete the segment
         success = await DatabaseUtils.delete_segment_by_id(segment_id)
@@ -278,6 +321,12 @@ class SegmentService:
         try:
             # OPTIMIZATION: Fetch existing segments ONCE for all validations
             existing_segments = await DatabaseUtils.get_segments_with_filters()
+            # Index them once so per-row overlap checks are binary searches, not scans
+            overlap_index = SegmentOverlapIndex(existing_segments)
+            # Same for EPG name uniqueness: (site, vrf, epg_name) -> segments
+            epg_index = OrganizationValidators.build_epg_index(existing_segments)
+            # And for VLAN existence: (network, site, vlan_id) keys of existing segments
+            existing_vlan_keys = {(s.get("vrf"), s.get("site"), s.get("vlan_id")) for s in existing_segments}
 
             created = 0
             errors = []
@@ -286,7 +335,7 @@ class SegmentService:
 
             for idx, segment in enumerate(segments, start=1):
                 try:
-                    logger.debug(f"Processing segment {idx}/{len(segments)}: site={segment.site}, vlan_id={segment.vlan_id}, segment={segment.segment}")
+                    logger.debug("Processing segment %s/%s: site=%s, vlan_id=%s, segment=%s", idx, len(segments), segment.site, segment.vlan_id, segment.segment)
 
                     # Check for duplicates within this bulk request first (network+site+vlan scope)
                     segment_key = (segment.vrf, segment.site, segment.vlan_id)
@@ -296,17 +345,16 @@ class SegmentService:
                         errors.append(error_msg)
                         continue
 
-                    # Validate segment data (uses pre-fetched existing_segments, passed via closure)
-                    await SegmentService._validate_segment_data(segment)
-
-                    # Check if VLAN ID already exists - check in cached existing_segments
-                    vlan_exists = any(
-                        s.get("site") == segment.site and
-                        s.get("vlan_id") == segment.vlan_id and
-                        s.get("vrf") == segment.vrf
-                        for s in existing_segments
+                    # Validate segment data against the pre-fetched existing_segments
+                    await SegmentService._validate_segment_data(
+                        segment,
+                        existing_segments=existing_segments,
+                        overlap_index=overlap_index,
+                        epg_index=epg_index
                     )
-                    if vlan_exists:
+
+                    # Check if VLAN ID already exists - set lookup instead of scanning existing_segments
+                    if segment_key in existing_vlan_keys:
                         error_msg = f"VLAN {segment.vlan_id} already exists for network '{segment.vrf}' at site '{segment.site}'"
                         logger.warning(f"Row {idx}: {error_msg}")
                         errors.append(error_msg)
@@ -318,10 +366,14 @@ class SegmentService:
 
                     # Add to tracking sets
                     created_in_bulk.add(segment_key)
-                    # Update cached existing_segments for next iteration
-                    existing_segments.append(new_segment if isinstance(new_segment, dict) else segment_data)
+                    existing_vlan_keys.add(segment_key)
+                    # Update cached existing_segments (and indexes) for next iteration
+                    created_segment = new_segment if isinstance(new_segment, dict) else segment_data
+                    existing_segments.append(created_segment)
+                    overlap_index.add(created_segment)
+                    OrganizationValidators.add_to_epg_index(epg_index, created_segment)
                     created += 1
-                    logger.debug(f"Successfully created segment {idx}: site={segment.site}, vlan_id={segment.vlan_id}")
+                    logger.debug("Successfully created segment %s: site=%s, vlan_id=%s", idx, segment.site, segment.vlan_id)
 
                 except HTTPException as e:
                     error_msg = f"Row {idx} (Site {segment.site}, VLAN {segment.vlan_id}): {e.detail}"
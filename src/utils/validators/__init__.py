@@ -10,8 +10,8 @@ Module structure:
 """
 
 from .input_validators import InputValidators
-from .network_validators import NetworkValidators
-from .organization_validators import OrganizationValidators
+from .network_validators import NetworkValidators, SegmentOverlapIndex
+from .organization_validators import OrganizationValidators, EpgIndex
 
 
 class Validators:
@@ -31,6 +31,7 @@ class Validators:
     validate_no_reserved_ips = staticmethod(NetworkValidators.validate_no_reserved_ips)
     validate_ip_overlap = staticmethod(NetworkValidators.validate_ip_overlap)
     validate_network_broadcast_gateway = staticmethod(NetworkValidators.validate_network_broadcast_gateway)
+    validate_segment_all = staticmethod(NetworkValidators.validate_segment_all)
 
     # Organization/business validation methods
     validate_segment_not_allocated = staticmethod(OrganizationValidators.validate_segment_not_allocated)
@@ -38,6 +39,25 @@ class Validators:
     validate_vrf = staticmethod(OrganizationValidators.validate_vrf)
 
 
+# Module-level bindings for hot paths (skip the Validators class indirection)
+validate_site = InputValidators.validate_site
+validate_object_id = InputValidators.validate_object_id
+validate_epg_name = InputValidators.validate_epg_name
+validate_vlan_id = InputValidators.validate_vlan_id
+validate_cluster_name = InputValidators.validate_cluster_name
+validate_description = InputValidators.validate_description
+
+validate_segment_format = NetworkValidators.validate_segment_format
+validate_subnet_mask = NetworkValidators.validate_subnet_mask
+validate_no_reserved_ips = NetworkValidators.validate_no_reserved_ips
+validate_ip_overlap = NetworkValidators.validate_ip_overlap
+validate_network_broadcast_gateway = NetworkValidators.validate_network_broadcast_gateway
+validate_segment_all = NetworkValidators.validate_segment_all
+
+validate_segment_not_allocated = OrganizationValidators.validate_segment_not_allocated
+validate_vlan_name_uniqueness = OrganizationValidators.validate_vlan_name_uniqueness
+validate_vrf = OrganizationValidators.validate_vrf
+
 
 # Export all classes for direct import if needed
 __all__ = [
@@ -45,4 +65,21 @@ __all__ = [
     "InputValidators",
     "NetworkValidators",
     "OrganizationValidators",
+    "SegmentOverlapIndex",
+    "EpgIndex",
+    "validate_site",
+    "validate_object_id",
+    "validate_epg_name",
+    "validate_vlan_id",
+    "validate_cluster_name",
+    "validate_description",
+    "validate_segment_format",
+    "validate_subnet_mask",
+    "validate_no_reserved_ips",
+    "validate_ip_overlap",
+    "validate_network_broadcast_gateway",
+    "validate_segment_all",
+    "validate_segment_not_allocated",
+    "validate_vlan_name_uniqueness",
+    "validate_vrf",
 ]
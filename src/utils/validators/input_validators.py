@@ -4,13 +4,37 @@ Handles validation of basic input fields like site, VLAN ID, EPG name, cluster n
 """
 
 import logging
-import re
+import string
 from fastapi import HTTPException
 
 from ...config.settings import SITES
 
 logger = logging.getLogger(__name__)
 
+# Configured sites, lowercased once (NetBox slugs are lowercase)
+_SITES_LOWER = frozenset(s.lower() for s in SITES)
+
+# Field length limits
+_EPG_MAX = 64
+_CLUSTER_MAX = 100
+_DESC_MAX = 500
+
+# Error detail templates for length violations (max, actual)
+_EPG_TOO_LONG_TMPL = "EPG name too long (max %d characters, got %d)"
+_CLUSTER_TOO_LONG_TMPL = "Cluster name too long (max %d characters, got %d)"
+_DESC_TOO_LONG_TMPL = "Description too long (max %d characters, got %d)"
+
+# Allowed characters for names; translating with these tables deletes every
+# allowed character, so any leftover means the name is invalid
+_EPG_ALLOWED = frozenset(string.ascii_letters + string.digits + '_-./')
+_EPG_DEL_TBL = str.maketrans('', '', ''.join(_EPG_ALLOWED))
+_CLUSTER_ALLOWED = frozenset(string.ascii_letters + string.digits + '_-.')
+_CLUSTER_DEL_TBL = str.maketrans('', '', ''.join(_CLUSTER_ALLOWED))
+
+# Control characters rejected in descriptions (tab, newline and carriage return are allowed)
+_CTRL_CHARS = ''.join(chr(c) for c in [*range(0, 9), 11, 12, *range(14, 32), 127])
+_CTRL_TABLE = str.maketrans('', '', _CTRL_CHARS)
+
 
 class InputValidators:
     """Validators for basic input fields"""
@@ -18,11 +42,9 @@ class InputValidators:
     @staticmethod
     def validate_site(site: str) -> None:
         """Validate if site is in configured sites (case-insensitive)"""
-        logger.debug(f"Validating site: {site}")
+        logger.debug("Validating site: %s", site)
         # Normalize to lowercase for comparison (NetBox slugs are lowercase)
-        site_lower = site.lower()
-        sites_lower = [s.lower() for s in SITES]
-        if site_lower not in sites_lower:
+        if site.lower() not in _SITES_LOWER:
             logger.warning(f"Invalid site: {site}, valid sites: {SITES}")
             raise HTTPException(
                 status_code=400,
@@ -32,7 +54,7 @@ class InputValidators:
     @staticmethod
     def validate_object_id(object_id: str) -> None:
         """Validate ID format (simple validation for string IDs)"""
-        logger.debug(f"Validating ID: {object_id}")
+        logger.debug("Validating ID: %s", object_id)
         if not object_id or not isinstance(object_id, str):
             logger.warning(f"Invalid ID format: {object_id}")
             raise HTTPException(
@@ -43,7 +65,7 @@ class InputValidators:
     @staticmethod
     def validate_epg_name(epg_name: str) -> None:
         """Validate that EPG name is not empty or whitespace only"""
-        logger.debug(f"Validating EPG name: '{epg_name}'")
+        logger.debug("Validating EPG name: '%s'", epg_name)
 
         if not epg_name or not epg_name.strip():
             logger.warning("Invalid EPG name: empty or whitespace only")
@@ -52,15 +74,15 @@ class InputValidators:
                 detail="EPG name cannot be empty or contain only whitespace"
             )
 
-        if len(epg_name) > 64:
+        if len(epg_name) > _EPG_MAX:
             logger.warning(f"EPG name too long: {len(epg_name)} characters")
             raise HTTPException(
                 status_code=400,
-                detail=f"EPG name too long (max 64 characters, got {len(epg_name)})"
+                detail=_EPG_TOO_LONG_TMPL % (_EPG_MAX, len(epg_name))
             )
 
         # Check for invalid characters (NetBox VLAN names have restrictions)
-        if not re.match(r'^[a-zA-Z0-9_\-\./]+$', epg_name):
+        if epg_name.translate(_EPG_DEL_TBL):
             logger.warning(f"EPG name contains invalid characters: '{epg_name}'")
             raise HTTPException(
                 status_code=400,
@@ -70,7 +92,7 @@ class InputValidators:
     @staticmethod
     def validate_vlan_id(vlan_id: int) -> None:
         """Validate VLAN ID is within valid range"""
-        logger.debug(f"Validating VLAN ID: {vlan_id}")
+        logger.debug("Validating VLAN ID: %s", vlan_id)
 
         if not isinstance(vlan_id, int):
             raise HTTPException(
@@ -92,7 +114,7 @@ class InputValidators:
     @staticmethod
     def validate_cluster_name(cluster_name: str) -> None:
         """Validate cluster name format"""
-        logger.debug(f"Validating cluster name: '{cluster_name}'")
+        logger.debug("Validating cluster name: '%s'", cluster_name)
 
         if not cluster_name or not cluster_name.strip():
             raise HTTPException(
@@ -100,15 +122,15 @@ class InputValidators:
                 detail="Cluster name cannot be empty or contain only whitespace"
             )
 
-        if len(cluster_name) > 100:
+        if len(cluster_name) > _CLUSTER_MAX:
             logger.warning(f"Cluster name too long: {len(cluster_name)} characters")
             raise HTTPException(
                 status_code=400,
-                detail=f"Cluster name too long (max 100 characters, got {len(cluster_name)})"
+                detail=_CLUSTER_TOO_LONG_TMPL % (_CLUSTER_MAX, len(cluster_name))
             )
 
         # Allow letters, numbers, hyphens, underscores, dots (for FQDNs)
-        if not re.match(r'^[a-zA-Z0-9_\-\.]+$', cluster_name):
+        if cluster_name.translate(_CLUSTER_DEL_TBL):
             logger.warning(f"Cluster name contains invalid characters: '{cluster_name}'")
             raise HTTPException(
                 status_code=400,
@@ -122,17 +144,18 @@ class InputValidators:
             # Empty descriptions are allowed
             return
 
-        logger.debug(f"Validating description: '{description[:50]}...'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validating description: '%s...'", description[:50])
 
-        if len(description) > 500:
+        if len(description) > _DESC_MAX:
             logger.warning(f"Description too long: {len(description)} characters")
             raise HTTPException(
                 status_code=400,
-                detail=f"Description too long (max 500 characters, got {len(description)})"
+                detail=_DESC_TOO_LONG_TMPL % (_DESC_MAX, len(description))
             )
 
         # Check for control characters (except newlines and tabs)
-        if re.search(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', description):
+        if len(description.translate(_CTRL_TABLE)) != len(description):
             logger.warning("Description contains invalid control characters")
             raise HTTPException(
                 status_code=400,
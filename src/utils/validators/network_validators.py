@@ -6,7 +6,9 @@ reserved IP ranges, overlap detection, and network/broadcast/gateway checks.
 
 import logging
 import ipaddress
-from typing import List, Dict, Any
+from bisect import bisect_left, insort
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
 from fastapi import HTTPException
 
 from ...config.settings import get_site_prefix, NETWORK_SITE_IP_PREFIXES
@@ -14,6 +16,91 @@ from ...config.settings import get_site_prefix, NETWORK_SITE_IP_PREFIXES
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parse_network(segment: str):
+    """Parse a segment string into a network (non-strict), cached for repeated segments
+
+    Network objects are immutable, so cached instances are safe to share.
+    Invalid input raises ValueError and is not cached.
+    """
+    return ipaddress.ip_network(segment, strict=False)
+
+
+class SegmentOverlapIndex:
+    """Sorted index of existing segments for repeated IP overlap checks
+
+    Build it once per batch (e.g. a bulk CSV import) and pass it to
+    validate_ip_overlap so each lookup is a binary search instead of a scan
+    over every existing segment. CIDR blocks are either disjoint or nested,
+    so an existing block overlaps a new one only if it starts inside the new
+    block or is one of its supernets.
+    """
+
+    def __init__(self, existing_segments: Iterable[Dict[str, Any]] = ()):
+        # Per IP version: sorted unique block start addresses
+        self._starts: Dict[int, List[int]] = {4: [], 6: []}
+        # (version, start) -> [(end, segment), ...]
+        self._blocks: Dict[Tuple[int, int], List[Tuple[int, Dict[str, Any]]]] = {}
+
+        for existing in existing_segments:
+            key = self._insert(existing)
+            if key:
+                self._starts[key[0]].append(key[1])
+        for starts in self._starts.values():
+            starts.sort()
+
+    def _insert(self, existing: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        """Record a segment; returns its (version, start) key if that start is new"""
+        if not existing.get("segment"):
+            return None
+
+        try:
+            network = _parse_network(existing["segment"])
+        except ValueError:
+            # Skip invalid existing segments
+            logger.warning(f"Skipping invalid existing segment: {existing.get('segment')}")
+            return None
+
+        key = (network.version, int(network.network_address))
+        is_new_start = key not in self._blocks
+        self._blocks.setdefault(key, []).append((int(network.broadcast_address), existing))
+        return key if is_new_start else None
+
+    def add(self, existing: Dict[str, Any]) -> None:
+        """Add a segment created after the index was built"""
+        key = self._insert(existing)
+        if key:
+            insort(self._starts[key[0]], key[1])
+
+    def find_overlap(self, network, exclude_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return an existing segment overlapping the given network, or None
+
+        Segments whose _id matches exclude_id (the segment being updated) are skipped.
+        """
+        version = network.version
+        start = int(network.network_address)
+        end = int(network.broadcast_address)
+
+        # Existing blocks starting inside the new block
+        starts = self._starts[version]
+        i = bisect_left(starts, start)
+        while i < len(starts) and starts[i] <= end:
+            for _, existing in self._blocks[(version, starts[i])]:
+                if not exclude_id or existing.get("_id") != exclude_id:
+                    return existing
+            i += 1
+
+        # Existing supernets of the new block (they start at its start masked to a shorter prefix)
+        max_prefixlen = network.max_prefixlen
+        for prefixlen in range(network.prefixlen - 1, -1, -1):
+            supernet_start = start & ~((1 << (max_prefixlen - prefixlen)) - 1)
+            for block_end, existing in self._blocks.get((version, supernet_start), ()):
+                if block_end >= start and (not exclude_id or existing.get("_id") != exclude_id):
+                    return existing
+
+        return None
+
+
 class NetworkValidators:
     """Validators for network and IP-related fields"""
 
@@ -29,215 +116,293 @@ class NetworkValidators:
         Raises:
             HTTPException: If segment format is invalid or doesn't match expected prefix
         """
-        logger.debug(f"Validating segment format: '{segment}' for {vrf}/{site}")
-        expected_prefix = get_site_prefix(site, vrf)
+        NetworkValidators._check_segment_format(segment, site, vrf)
 
-        # Validate that prefix mapping exists for this network+site combination
-        if expected_prefix is None:
-            # Show available combinations for this network or this site
-            available_combinations = list(NETWORK_SITE_IP_PREFIXES.keys())
+    @staticmethod
+    def validate_subnet_mask(segment: str) -> None:
+        """Validate subnet mask is within reasonable range"""
+        try:
+            network = _parse_network(segment)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid network format: {str(e)}"
+            )
+        NetworkValidators._check_subnet_mask(network)
 
-            # Filter to show relevant combinations
-            same_network = [f"{n}:{s}" for n, s in available_combinations if n == vrf]
-            same_site = [f"{n}:{s}" for n, s in available_combinations if s == site]
+    @staticmethod
+    def validate_no_reserved_ips(segment: str) -> None:
+        """Validate that segment doesn't use reserved/special IP ranges"""
+        try:
+            network = _parse_network(segment)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid IP network: {str(e)}"
+            )
+        NetworkValidators._check_no_reserved_ips(network, segment)
 
-            error_detail = f"Network '{vrf}' at site '{site}' is not configured. "
+    @staticmethod
+    def validate_segment_all(segment: str, site: str, vrf: str = None) -> None:
+        """Run all single-segment network checks on one parse of the segment
 
-            if same_network:
-                error_detail += f"\n• Network '{vrf}' is available at sites: {', '.join([s for n, s in available_combinations if n == vrf])}"
-            else:
-                error_detail += f"\n• Network '{vrf}' is not configured at any site"
+        Equivalent to calling validate_segment_format, validate_subnet_mask,
+        validate_no_reserved_ips and validate_network_broadcast_gateway in that order.
 
-            if same_site:
-                error_detail += f"\n• Site '{site}' is available in networks: {', '.join([n for n, s in available_combinations if s == site])}"
-            else:
-                error_detail += f"\n• Site '{site}' is not configured in any network"
+        Args:
+            segment: IP network in CIDR format (e.g., "192.168.1.0/24")
+            site: Site name (e.g., "Site1")
+            vrf: VRF/Network name (e.g., "Network1")
 
-            error_detail += f"\n• To enable this combination, add: NETWORK_SITE_PREFIXES='{vrf}:{site}:<prefix>'"
+        Raises:
+            HTTPException: On the first failed check
+        """
+        network = NetworkValidators._check_segment_format(segment, site, vrf)
+        NetworkValidators._check_subnet_mask(network)
+        NetworkValidators._check_no_reserved_ips(network, segment)
+        NetworkValidators._check_network_size(network, segment)
 
-            logger.error(f"No IP prefix configured for {vrf}/{site}")
-            raise HTTPException(status_code=400, detail=error_detail)
+    @staticmethod
+    def validate_ip_overlap(
+        new_segment: str,
+        existing_segments: Union[List[Dict[str, Any]], SegmentOverlapIndex],
+        exclude_id: Optional[str] = None
+    ) -> None:
+        """
+        Validate that a new segment doesn't overlap with existing segments
+
+        Args:
+            new_segment: New IP network to validate (e.g., "192.168.1.0/24")
+            existing_segments: List of existing segment dictionaries with 'segment' field,
+                or a SegmentOverlapIndex built from them (for batch validation)
+            exclude_id: Segment ID to exclude from check (for updates)
 
+        Raises:
+            HTTPException: If overlap detected
+        """
         try:
-            # First validate that the segment includes explicit subnet mask
-            if '/' not in segment:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid network format. Segment must include subnet mask (e.g., '{segment}/24')"
-                )
+            new_network = _parse_network(new_segment)
+            overlapping = None
+            # Segment IDs are already strings (see prefix_to_segment); normalize exclude_id once
+            exclude_id = str(exclude_id) if exclude_id else None
 
-            # Then validate that the segment is in proper network format
-            try:
-                ipaddress.ip_network(segment, strict=True)
-            except ipaddress.AddressValueError:
-                # If strict parsing fails, get the correct network address
-                network_loose = ipaddress.ip_network(segment, strict=False)
-                correct_format = str(network_loose)
+            if isinstance(existing_segments, SegmentOverlapIndex):
+                overlapping = existing_segments.find_overlap(new_network, exclude_id)
+            else:
+                # Compare integer bounds instead of calling overlaps() per existing segment
+                new_version = new_network.version
+                new_start = int(new_network.network_address)
+                new_end = int(new_network.broadcast_address)
+
+                for existing in existing_segments:
+                    if not existing.get("segment"):
+                        continue
+                    if exclude_id and existing.get("_id") == exclude_id:
+                        continue
+
+                    try:
+                        existing_network = _parse_network(existing["segment"])
+                    except ValueError:
+                        # Skip invalid existing segments
+                        logger.warning(f"Skipping invalid existing segment: {existing.get('segment')}")
+                        continue
+
+                    # Check if networks overlap (same IP version only, like overlaps())
+                    if (existing_network.version == new_version and
+                        int(existing_network.network_address) <= new_end and
+                        int(existing_network.broadcast_address) >= new_start):
+                        overlapping = existing
+                        break
+
+            if overlapping:
+                logger.warning(f"IP overlap detected: {new_segment} overlaps with {overlapping['segment']}")
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Invalid network format. Use network address '{correct_format}' instead of '{segment}'"
+                    detail=f"IP segment {new_segment} overlaps with existing segment {overlapping['segment']} "
+                           f"(Site: {overlapping.get('site')}, VLAN: {overlapping.get('vlan_id')})"
                 )
 
-            # Parse the network segment for site prefix validation
-            network = ipaddress.ip_network(segment, strict=False)
-            first_octet = str(network.network_address).split('.')[0]
+            logger.debug("No IP overlap detected for %s", new_segment)
 
-            if first_octet != expected_prefix:
-                logger.warning(f"IP prefix mismatch for {vrf}/{site}: expected '{expected_prefix}', got '{first_octet}'")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid IP prefix for network '{vrf}' at site '{site}'. "
-                           f"Expected to start with '{expected_prefix}', got '{first_octet}'"
-                )
-
-        except ipaddress.AddressValueError:
-            logger.warning(f"Invalid IP network format: {segment}")
-            raise HTTPException(status_code=400, detail="Invalid IP network format")
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid IP network format: {str(e)}"
+            )
 
     @staticmethod
-    def validate_subnet_mask(segment: str) -> None:
-        """Validate subnet mask is within reasonable range"""
-        try:
-            network = ipaddress.ip_network(segment, strict=False)
-            prefix_len = network.prefixlen
-
-            # Typical datacenter subnets: /16 to /31
-            # /32 is a host route, not a network
-            # /8 to /15 are too large for typical allocations
-            if prefix_len < 16 or prefix_len > 31:
-                logger.warning(f"Unusual subnet mask: /{prefix_len}")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Subnet mask /{prefix_len} is outside supported range (/16 to /31). "
-                           f"Use /16-/24 for large networks, /25-/29 for smaller subnets, "
-                           f"or /30-/31 for point-to-point links (RFC 3021)."
-                )
+    def validate_network_broadcast_gateway(segment: str) -> None:
+        """
+        Validate network has sufficient usable IPs (not just network and broadcast)
 
-            logger.debug(f"Subnet mask validation passed: /{prefix_len}")
+        A /31 network has only 2 IPs (both usable in point-to-point)
+        A /30 network has 4 IPs (2 usable, 2 for network/broadcast)
+        Warn about very small networks
+        """
+        try:
+            network = _parse_network(segment)
         except ValueError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid network format: {str(e)}"
             )
+        NetworkValidators._check_network_size(network, segment)
 
     @staticmethod
-    def validate_no_reserved_ips(segment: str) -> None:
-        """Validate that segment doesn't use reserved/special IP ranges"""
-        try:
-            network = ipaddress.ip_network(segment, strict=False)
+    def _check_segment_format(segment: str, site: str, vrf: str = None):
+        """Format and site prefix checks for validate_segment_format; returns the parsed network"""
+        logger.debug("Validating segment format: '%s' for %s/%s", segment, vrf, site)
+        expected_prefix = get_site_prefix(site, vrf)
+
+        # Validate that prefix mapping exists for this network+site combination
+        if expected_prefix is None:
+            # Show available combinations for this network or this site (single pass)
+            same_network_sites, same_site_networks = [], []
+            for n, s in NETWORK_SITE_IP_PREFIXES:
+                if n == vrf:
+                    same_network_sites.append(s)
+                if s == site:
+                    same_site_networks.append(n)
+
+            error_detail = f"Network '{vrf}' at site '{site}' is not configured. "
+
+            if same_network_sites:
+                error_detail += f"\n• Network '{vrf}' is available at sites: {', '.join(same_network_sites)}"
+            else:
+                error_detail += f"\n• Network '{vrf}' is not configured at any site"
+
+            if same_site_networks:
+                error_detail += f"\n• Site '{site}' is available in networks: {', '.join(same_site_networks)}"
+            else:
+                error_detail += f"\n• Site '{site}' is not configured in any network"
 
-            # Check for reserved ranges
-            # 0.0.0.0/8 - Current network
-            # 10.0.0.0/8, 172.16.0.0/12, 192.168.0.0/16 - Private (OK for datacenter)
-            # 127.0.0.0/8 - Loopback
-            # 169.254.0.0/16 - Link-local
-            # 224.0.0.0/4 - Multicast
-            # 240.0.0.0/4 - Reserved
+            error_detail += f"\n• To enable this combination, add: NETWORK_SITE_PREFIXES='{vrf}:{site}:<prefix>'"
 
-            first_octet = int(str(network.network_address).split('.')[0])
+            logger.error(f"No IP prefix configured for {vrf}/{site}")
+            raise HTTPException(status_code=400, detail=error_detail)
 
-            # Disallow certain ranges
-            if first_octet == 0:
+        try:
+            # First validate that the segment includes explicit subnet mask
+            if '/' not in segment:
                 raise HTTPException(
                     status_code=400,
-                    detail="Cannot use 0.0.0.0/8 network (current network identifier)"
+                    detail=f"Invalid network format. Segment must include subnet mask (e.g., '{segment}/24')"
                 )
 
-            if first_octet == 127:
+            # Parse once: the interface keeps the address as written plus its network
+            interface = ipaddress.ip_interface(segment)
+            network = interface.network
+
+            if network.version != 4:
+                logger.warning(f"Non-IPv4 segment rejected: {segment}")
                 raise HTTPException(
                     status_code=400,
-                    detail="Cannot use 127.0.0.0/8 network (loopback addresses)"
+                    detail=f"Invalid network format. Only IPv4 segments are supported, got '{segment}'"
                 )
 
-            if first_octet == 169 and str(network.network_address).startswith("169.254"):
+            # Then validate that the segment is in proper network format (no host bits set)
+            if interface.ip != network.network_address:
                 raise HTTPException(
                     status_code=400,
-                    detail="Cannot use 169.254.0.0/16 network (link-local addresses)"
+                    detail=f"Invalid network format. Use network address '{network}' instead of '{segment}'"
                 )
 
-            if first_octet >= 224:
+            # Validate site prefix against the first octet (top byte of the address)
+            first_octet = int(network.network_address) >> 24
+
+            if str(first_octet) != expected_prefix:
+                logger.warning(f"IP prefix mismatch for {vrf}/{site}: expected '{expected_prefix}', got '{first_octet}'")
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Cannot use {first_octet}.0.0.0/8 network (multicast/reserved range)"
+                    detail=f"Invalid IP prefix for network '{vrf}' at site '{site}'. "
+                           f"Expected to start with '{expected_prefix}', got '{first_octet}'"
                 )
 
-            logger.debug(f"Reserved IP validation passed for {segment}")
+        except ValueError:
+            logger.warning(f"Invalid IP network format: {segment}")
+            raise HTTPException(status_code=400, detail="Invalid IP network format")
+
+        return network
 
-        except ipaddress.AddressValueError as e:
+    @staticmethod
+    def _check_subnet_mask(network) -> None:
+        """Subnet mask range check on a parsed network"""
+        prefix_len = network.prefixlen
+
+        # Typical datacenter subnets: /16 to /31
+        # /32 is a host route, not a network
+        # /8 to /15 are too large for typical allocations
+        if prefix_len < 16 or prefix_len > 31:
+            logger.warning(f"Unusual subnet mask: /{prefix_len}")
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid IP network: {str(e)}"
+                detail=f"Subnet mask /{prefix_len} is outside supported range (/16 to /31). "
+                       f"Use /16-/24 for large networks, /25-/29 for smaller subnets, "
+                       f"or /30-/31 for point-to-point links (RFC 3021)."
             )
 
-    @staticmethod
-    def validate_ip_overlap(new_segment: str, existing_segments: List[Dict[str, Any]]) -> None:
-        """
-        Validate that a new segment doesn't overlap with existing segments
+        logger.debug("Subnet mask validation passed: /%s", prefix_len)
 
-        Args:
-            new_segment: New IP network to validate (e.g., "192.168.1.0/24")
-            existing_segments: List of existing segment dictionaries with 'segment' field
-
-        Raises:
-            HTTPException: If overlap detected
-        """
-        try:
-            new_network = ipaddress.ip_network(new_segment, strict=False)
-
-            for existing in existing_segments:
-                if not existing.get("segment"):
-                    continue
-
-                try:
-                    existing_network = ipaddress.ip_network(existing["segment"], strict=False)
-
-                    # Check if networks overlap
-                    if new_network.overlaps(existing_network):
-                        logger.warning(f"IP overlap detected: {new_segment} overlaps with {existing['segment']}")
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"IP segment {new_segment} overlaps with existing segment {existing['segment']} "
-                                   f"(Site: {existing.get('site')}, VLAN: {existing.get('vlan_id')})"
-                        )
+    @staticmethod
+    def _check_no_reserved_ips(network, segment: str) -> None:
+        """Reserved/special range checks on a parsed network"""
+        # Check for reserved ranges
+        # 0.0.0.0/8 - Current network
+        # 10.0.0.0/8, 172.16.0.0/12, 192.168.0.0/16 - Private (OK for datacenter)
+        # 127.0.0.0/8 - Loopback
+        # 169.254.0.0/16 - Link-local
+        # 224.0.0.0/4 - Multicast
+        # 240.0.0.0/4 - Reserved
+
+        # Reserved ranges below are IPv4-only
+        if network.version != 4:
+            logger.warning(f"Non-IPv4 segment rejected: {segment}")
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid network format. Only IPv4 segments are supported, got '{segment}'"
+            )
 
-                except ValueError:
-                    # Skip invalid existing segments
-                    logger.warning(f"Skipping invalid existing segment: {existing.get('segment')}")
-                    continue
+        ip_int = int(network.network_address)
+        first_octet = ip_int >> 24
 
-            logger.debug(f"No IP overlap detected for {new_segment}")
+        # Disallow certain ranges
+        if first_octet == 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot use 0.0.0.0/8 network (current network identifier)"
+            )
 
-        except ValueError as e:
+        if first_octet == 127:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid IP network format: {str(e)}"
+                detail="Cannot use 127.0.0.0/8 network (loopback addresses)"
             )
 
-    @staticmethod
-    def validate_network_broadcast_gateway(segment: str) -> None:
-        """
-        Validate network has sufficient usable IPs (not just network and broadcast)
+        if (ip_int & 0xFFFF0000) == 0xA9FE0000:  # 169.254.0.0/16
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot use 169.254.0.0/16 network (link-local addresses)"
+            )
 
-        A /31 network has only 2 IPs (both usable in point-to-point)
-        A /30 network has 4 IPs (2 usable, 2 for network/broadcast)
-        Warn about very small networks
-        """
-        try:
-            network = ipaddress.ip_network(segment, strict=False)
-            num_addresses = network.num_addresses
+        if first_octet >= 224:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot use {first_octet}.0.0.0/8 network (multicast/reserved range)"
+            )
 
-            # Reject networks with fewer than 2 addresses (/32 host routes)
-            if num_addresses < 2:
-                logger.warning(f"Network too small: {segment} has only {num_addresses} addresses")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Network {segment} has fewer than 2 addresses and cannot be used as a subnet."
-                )
+        logger.debug("Reserved IP validation passed for %s", segment)
 
-            logger.debug(f"Network validation passed: {segment} has {num_addresses} addresses")
+    @staticmethod
+    def _check_network_size(network, segment: str) -> None:
+        """Minimum size check on a parsed network"""
+        num_addresses = network.num_addresses
 
-        except ValueError as e:
+        # Reject networks with fewer than 2 addresses (/32 host routes)
+        if num_addresses < 2:
+            logger.warning(f"Network too small: {segment} has only {num_addresses} addresses")
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid network format: {str(e)}"
+                detail=f"Network {segment} has fewer than 2 addresses and cannot be used as a subnet."
             )
+
+        logger.debug("Network validation passed: %s has %s addresses", segment, num_addresses)
@@ -5,11 +5,14 @@ EPG name uniqueness, and concurrent modification detection.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
+# (site, vrf, epg_name) -> segments using that EPG name in that scope
+EpgIndex = Dict[Tuple[str, str, str], List[Dict[str, Any]]]
+
 
 class OrganizationValidators:
     """Validators for business logic and organizational rules"""
@@ -30,7 +33,8 @@ class OrganizationValidators:
         epg_name: str,
         vlan_id: int,
         existing_segments: List[Dict[str, Any]],
-        exclude_id: Optional[str] = None
+        exclude_id: Optional[str] = None,
+        index: Optional[EpgIndex] = None
     ) -> None:
         """
         Validate that EPG name + VLAN ID combination is unique per (network, site)
@@ -50,10 +54,16 @@ class OrganizationValidators:
             vlan_id: VLAN ID (1-4094)
             existing_segments: List of existing segments to check against
             exclude_id: Segment ID to exclude from check (for updates)
+            index: Optional index of existing_segments from build_epg_index (for batch
+                validation). When given, only the matching segments are checked.
         """
-        for segment in existing_segments:
+        candidates = existing_segments if index is None else index.get((site, vrf, epg_name), ())
+        # Segment IDs are already strings (see prefix_to_segment); normalize exclude_id once
+        exclude_id_str = str(exclude_id) if exclude_id else None
+
+        for segment in candidates:
             # Skip if this is the segment being updated
-            if exclude_id and str(segment.get("_id")) == str(exclude_id):
+            if exclude_id_str and segment.get("_id") == exclude_id_str:
                 continue
 
             # Check same (network, site) combination only
@@ -71,7 +81,24 @@ class OrganizationValidators:
                            f"in network '{vrf}' at site '{site}'. Cannot assign it to VLAN {vlan_id}."
                 )
 
-        logger.debug(f"EPG name uniqueness validation passed for {epg_name} in {vrf}/{site}")
+        logger.debug("EPG name uniqueness validation passed for %s in %s/%s", epg_name, vrf, site)
+
+    @staticmethod
+    def build_epg_index(segments: List[Dict[str, Any]]) -> EpgIndex:
+        """Index segments by (site, vrf, epg_name) for validate_vlan_name_uniqueness
+
+        Build once per batch and keep it current with add_to_epg_index.
+        """
+        index: EpgIndex = {}
+        for segment in segments:
+            OrganizationValidators.add_to_epg_index(index, segment)
+        return index
+
+    @staticmethod
+    def add_to_epg_index(index: EpgIndex, segment: Dict[str, Any]) -> None:
+        """Add a segment to an index built by build_epg_index"""
+        key = (segment.get("site"), segment.get("vrf"), segment.get("epg_name"))
+        index.setdefault(key, []).append(segment)
 
     @staticmethod
     async def validate_vrf(vrf: str) -> None:
@@ -86,7 +113,7 @@ class OrganizationValidators:
         # Import get_storage to use singleton pattern (not NetBoxStorage directly)
         from ...database.netbox_storage import get_storage
 
-        logger.debug(f"Validating VRF: {vrf}")
+        logger.debug("Validating VRF: %s", vrf)
 
         if not vrf or not vrf.strip():
             logger.warning("VRF name is empty")
@@ -98,17 +125,16 @@ class OrganizationValidators:
         # Get available VRFs from NetBox using singleton
         storage = get_storage()
         try:
-            # Get VRFs from storage
-            available_vrfs = await storage.get_vrfs()
-
-            if vrf not in available_vrfs:
+            # Hash lookup against the cached VRF set; the list is only needed for the error message
+            if vrf not in await storage.get_vrf_set():
+                available_vrfs = await storage.get_vrfs()
                 logger.warning(f"Invalid VRF: {vrf}, available VRFs: {available_vrfs}")
                 raise HTTPException(
                     status_code=400,
                     detail=f"Invalid VRF. Must be one of: {', '.join(available_vrfs)}"
                 )
 
-            logger.debug(f"VRF validation passed: {vrf}")
+            logger.debug("VRF validation passed: %s", vrf)
         except HTTPException:
             raise
         except Exception as e: